@@ -17,10 +17,18 @@ command line on Windows.
 # https://www.mathworks.com/help/matlab/matlab_external/get-started-with-matlab-engine-for-python.html
 
 
+import multiprocessing
+import os
+import re
+import selectors
 import subprocess
+import sys
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from os.path import isfile
 from typing import Union, List
-from collections import Iterable
 
 # default command line options/flags that are appended to the executable
 # for details see https://www.mathworks.com/help/matlab/ref/matlabwindows.html
@@ -28,6 +36,16 @@ option_defaults = dict(
     # launches command windows instead of full desktop GUI
     nodesktop=False,
 
+    # Start MATLAB without the JVM. Skips Java startup, by far the biggest
+    # share of launch time, but disables features that need Java/Swing.
+    # Combined with a persistent session this makes repeat `execute` calls
+    # close to free.
+    nojvm=False,
+
+    # Do not display any X commands (Linux/macOS only). Useful for a
+    # persistent session on a headless machine.
+    nodisplay=False,
+
     # Disable the display of figure windows in MATLAB.
     noFigureWindows=False,
 
@@ -78,12 +96,207 @@ option_defaults = dict(
     wait=False,
 )
 
-# wraps MATLAB statement with a try-catch block to silence exceptions
-try_catch_wrapper = \
-    "try, {}, catch err, fprintf('%s %s', err.identifier, err.message), end"
-# appends to MATLAB block an exit statement to automatically close the
-# window after running
-exit_wrapper = "{}, exit"
+# flag names accepted by set_options, precomputed once so validation is a
+# set difference instead of rebuilding sets on every call
+_VALID_FLAGS = frozenset(option_defaults)
+
+# per-type formatters for option values, so building a parameter is a single
+# dict lookup on the value's type instead of an isinstance chain
+_OPTION_FORMATTERS = {
+    bool: lambda k, v: [f"-{k}"] if v else [],
+    str: lambda k, v: [f"-{k}", v],
+    int: lambda k, v: [f"-{k}", str(v)],
+    float: lambda k, v: [f"-{k}", str(v)],
+}
+
+# wrap a MATLAB statement with a try-catch block to silence exceptions
+# kept as prefix/suffix fragments so wrapping is plain concatenation, which
+# is faster than str.format for a single substitution
+_TRY_PREFIX = "try, "
+_TRY_SUFFIX = \
+    ", catch err, fprintf('%s %s', err.identifier, err.message), end"
+
+# appended to a MATLAB block to automatically close the window after running
+_EXIT_SUFFIX = ", exit"
+
+# printed by the persistent MATLAB session after each command block so the
+# driver knows where the output for that block ends
+sentinel_template = "__MATRUN_DONE__{}__"
+
+# buffer size for the driver-side file objects wrapping the MATLAB pipes,
+# and the chunk size for selector reads
+# this sizes Python's own buffering, so large outputs cost fewer read
+# syscalls; it does not change the kernel pipe capacity, and stalls on
+# large outputs are prevented by draining continuously, not by this setting
+_PIPE_BUFFER_SIZE = 1 << 20
+
+# grammar for the statement subset this driver is normally fed: a script
+# call (bare name), a call with arguments, or an assignment of a string,
+# number or numeric matrix literal
+# precompiled once so validation is a single regex match per statement
+_MATLAB_NAME = r"[A-Za-z]\w*"
+_MATLAB_STRING = r"'[^']*'"
+_MATLAB_NUMBER = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_MATLAB_MATRIX = rf"\[(?:\s*{_MATLAB_NUMBER}\s*[,;]?)*\s*\]"
+_STATEMENT_REGEX = re.compile(
+    rf"^\s*{_MATLAB_NAME}\s*"
+    rf"(?:\([^()]*\)|=\s*(?:{_MATLAB_STRING}|{_MATLAB_NUMBER}"
+    rf"|{_MATLAB_MATRIX}))?\s*$"
+)
+
+
+def _validate_statement(statement: str) -> None:
+    """
+    Checks `statement` against the assignment / script-call subset of MATLAB
+    syntax, raising ValueError if it does not match.
+
+    A parse failure here costs microseconds; the same typo surfacing inside
+    MATLAB costs a full process startup before it is reported.
+    """
+    if not _STATEMENT_REGEX.match(statement):
+        raise ValueError(
+            f"Statement {statement!r} is not a valid assignment or "
+            f"script call"
+        )
+
+
+# persistent runner owned by each `map_parallel` pool worker
+# a runner holding a live process handle cannot be pickled, so it has to be
+# created inside the worker rather than passed in from the parent
+_worker_runner = None
+
+
+def _init_worker_runner(exe_path, options):
+    global _worker_runner
+    _worker_runner = MatlabRunner(exe_path, **options)
+    _worker_runner.start()
+
+
+def _run_in_worker(indexed_statement):
+    index, statement = indexed_statement
+    return index, _worker_runner.execute(statement, persistent=True)
+
+
+if sys.platform == "win32":
+    import ctypes
+
+    # kills every process in a job when the last handle to the job closes
+    _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+
+    # information class for SetInformationJobObject
+    _JobObjectExtendedLimitInformation = 9
+
+    class _IO_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_uint64),
+            ("WriteOperationCount", ctypes.c_uint64),
+            ("OtherOperationCount", ctypes.c_uint64),
+            ("ReadTransferCount", ctypes.c_uint64),
+            ("WriteTransferCount", ctypes.c_uint64),
+            ("OtherTransferCount", ctypes.c_uint64),
+        ]
+
+    class _JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("PerProcessUserTimeLimit", ctypes.c_int64),
+            ("PerJobUserTimeLimit", ctypes.c_int64),
+            ("LimitFlags", ctypes.c_uint32),
+            ("MinimumWorkingSetSize", ctypes.c_size_t),
+            ("MaximumWorkingSetSize", ctypes.c_size_t),
+            ("ActiveProcessLimit", ctypes.c_uint32),
+            ("Affinity", ctypes.c_void_p),
+            ("PriorityClass", ctypes.c_uint32),
+            ("SchedulingClass", ctypes.c_uint32),
+        ]
+
+    class _JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("BasicLimitInformation", _JOBOBJECT_BASIC_LIMIT_INFORMATION),
+            ("IoInfo", _IO_COUNTERS),
+            ("ProcessMemoryLimit", ctypes.c_size_t),
+            ("JobMemoryLimit", ctypes.c_size_t),
+            ("PeakProcessMemoryUsed", ctypes.c_size_t),
+            ("PeakJobMemoryUsed", ctypes.c_size_t),
+        ]
+
+    # explicit signatures so job and process handles travel as pointer-sized
+    # values instead of ctypes' default c_int conversions, which truncate
+    # 64-bit handles
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.CreateJobObjectW.restype = ctypes.c_void_p
+    _kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p]
+    _kernel32.SetInformationJobObject.restype = ctypes.c_int
+    _kernel32.SetInformationJobObject.argtypes = [
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_uint32
+    ]
+    _kernel32.AssignProcessToJobObject.restype = ctypes.c_int
+    _kernel32.AssignProcessToJobObject.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p
+    ]
+
+    def _create_kill_on_close_job():
+        """
+        Creates a Windows job object that kills every process assigned to it
+        when the last handle to the job closes. Since the Python driver holds
+        that handle, the kernel reaps any MATLAB children still running when
+        the driver exits, even if it was killed or Ctrl-C'd.
+        """
+        job = _kernel32.CreateJobObjectW(None, None)
+        if not job:
+            raise ctypes.WinError()
+
+        info = _JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+        info.BasicLimitInformation.LimitFlags = \
+            _JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+
+        if not _kernel32.SetInformationJobObject(
+                job,
+                _JobObjectExtendedLimitInformation,
+                ctypes.byref(info),
+                ctypes.sizeof(info)
+        ):
+            raise ctypes.WinError()
+
+        return job
+
+
+def _auto_scratch_dir() -> str:
+    """
+    Picks the fastest usable directory for MAT-file data exchange between
+    Python and MATLAB.
+
+    On Linux this prefers /dev/shm, a RAM-backed tmpfs, so reading and
+    writing exchange files never touches disk; Snap sandboxes remap
+    /dev/shm, so it is skipped there. Everywhere else this falls back to the
+    system temp directory, which users can point at a RAM disk.
+    """
+    if (
+            sys.platform == "linux"
+            and os.path.isdir("/dev/shm")
+            and os.access("/dev/shm", os.W_OK)
+            and not os.environ.get("SNAP")
+    ):
+        return "/dev/shm"
+
+    return tempfile.gettempdir()
+
+
+def _drain_output(pipe, output_lines, log_path):
+    """
+    Read `pipe` to exhaustion on a background thread, collecting lines into
+    `output_lines` and optionally tee-ing them to the file at `log_path`.
+    Draining continuously keeps the pipe buffer from filling up and
+    deadlocking the MATLAB process.
+    """
+    log_file = open(log_path, "w") if log_path is not None else None
+    try:
+        for line in pipe:
+            output_lines.append(line)
+            if log_file is not None:
+                log_file.write(line)
+    finally:
+        if log_file is not None:
+            log_file.close()
 
 
 class MatlabRunner:
@@ -99,58 +312,80 @@ class MatlabRunner:
         """
         self._exe_path = exe_path
         self._options = {}
+        self._process = None
+        self._queue = []
+        self._command_argv_cache = None
+        self._exe_verified = False
+        self._scratch_dir = None
+        self._job_handle = None
         self.set_options(**options)
 
+    def __enter__(self) -> 'MatlabRunner':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
     @staticmethod
     def _build_options_parameter(
             k: str, v: Union[int, str, bool]
-    ) -> Union[str, None]:
+    ) -> List[str]:
         """
-        Builds a command-line ready string flag from an option key-value pair
+        Builds a list of command-line ready arguments from an option
+        key-value pair. A False value contributes no arguments.
         """
-        if k not in option_defaults:
+        if k not in _VALID_FLAGS:
             raise ValueError(
                 f"Key {k} is not a valid matlab.exe flag."
                 f"Valid flags are {tuple(option_defaults.keys())}"
             )
 
-        if v is True:
-            return f"-{k}"
-        elif v is False:
-            return None
-        elif isinstance(v, str):
-            return f'-{k} "{v}"'
-        elif isinstance(v, (int, float)):
-            return f'-{k} {v}'
-        else:
+        formatter = _OPTION_FORMATTERS.get(type(v))
+        if formatter is None:
             raise ValueError(f"Value for Key {k} is not a number or a string")
 
-    def _build_options_string(self) -> str:
+        return formatter(k, v)
+
+    def _build_options_argv(self) -> List[str]:
         """
-        Builds the flags components of the command line string using the stored
-        options dictionary
+        Builds the flag arguments of the command line using the stored
+        options dictionary.
+
+        A single flattening pass with no intermediate per-option lists to
+        filter; `set_options` drops False values at insertion, so every
+        stored option contributes arguments.
         """
-        return " ".join(
-            param for param in
-            [
-                self._build_options_parameter(k, v)
-                for k, v in self._options.items()
-            ]
-            if param is not None
-        )
+        return [
+            arg
+            for k, v in self._options.items()
+            for arg in self._build_options_parameter(k, v)
+        ]
 
-    def _build_command_header(self) -> str:
+    def _build_command_argv(self) -> List[str]:
         """
-        Builds the command line header containing the executable path and the
-        flags
+        Builds the command line argument list containing the executable path
+        and the flags.
+
+        Passing this list straight to subprocess avoids spawning a shell to
+        parse a command string (one fewer process per call) and lets the OS
+        argument boundaries handle quoting of values.
+
+        The built list is cached so repeated `execute` calls skip rebuilding
+        it; `set_exe_path` and `set_options` invalidate the cache.
         """
-        return f"""{self._exe_path} {self._build_options_string()}"""
+        if self._command_argv_cache is None:
+            self._command_argv_cache = \
+                [self._exe_path, *self._build_options_argv()]
+        return self._command_argv_cache
 
     def set_exe_path(self, exe_path: str):
         """
         Set the `matlab.exe` executable path for this runner
         """
         self._exe_path = exe_path
+        self._command_argv_cache = None
+        self._exe_verified = False
 
     def set_options(self, **options: Union[bool, str, int, float]) -> None:
         """
@@ -158,30 +393,274 @@ class MatlabRunner:
         For details see
             https://www.mathworks.com/help/matlab/ref/matlabwindows.html
         """
-        invalid_options = set(options.keys()) - set(option_defaults.keys())
+        invalid_options = options.keys() - _VALID_FLAGS
         if invalid_options:
             raise ValueError(f'Invalid options: {list(invalid_options)}')
         else:
-            self._options = {
-                **option_defaults,
-                **self._options,
-                **(options or {})
-            }
+            # only truthy values contribute to the command line, so storing
+            # just those keeps the options dictionary (and every later
+            # iteration over it) small; a False value clears a stored flag
+            for k, v in options.items():
+                if v is False:
+                    self._options.pop(k, None)
+                else:
+                    self._options[k] = v
+            self._command_argv_cache = None
+
+    def set_scratch_dir(
+            self, path: Union[str, None] = None, auto=True
+    ) -> Union[str, None]:
+        """
+        Set the directory MATLAB statements should use for MAT-file data
+        exchange with Python, and return the chosen path.
+
+        The path is handed to every executed statement as a prepended
+        `scratch_dir='...'` assignment, so scripts can read and write their
+        exchange files under `scratch_dir`. Keeping those files on RAM-backed
+        storage avoids a disk round trip per transfer.
+
+        :param path: Scratch directory to use. Takes precedence over `auto`.
+        :param auto: Pick a directory automatically: /dev/shm on Linux when
+            it is writable (and not remapped by a Snap sandbox), otherwise
+            the system temp directory. Pass False with no `path` to stop
+            prepending the assignment.
+        """
+        if path is not None:
+            self._scratch_dir = path
+        elif auto:
+            self._scratch_dir = _auto_scratch_dir()
+        else:
+            self._scratch_dir = None
+
+        return self._scratch_dir
+
+    def _prepend_scratch_dir(self, statement: str) -> str:
+        """
+        Prepend the `scratch_dir` assignment to `statement` if a scratch
+        directory has been set
+        """
+        if self._scratch_dir is None:
+            return statement
+
+        return f"scratch_dir='{self._scratch_dir}', " + statement
+
+    def invalidate_exe_cache(self) -> None:
+        """
+        Force the next execution to re-check that the executable exists.
+
+        Only needed if the MATLAB installation might have been removed or
+        replaced while this runner is in use; the check result is otherwise
+        cached after the first success so repeated `execute` calls skip the
+        filesystem access.
+        """
+        self._exe_verified = False
 
     def _assert_exe_exists(self):
+        if self._exe_verified:
+            return
+
         if not isfile(self._exe_path):
-            raise FileExistsError(
+            raise FileNotFoundError(
                 f"MATLAB executable at {self._exe_path} does not exist"
             )
 
+        self._exe_verified = True
+
+    def _assign_to_job(self, process: subprocess.Popen) -> None:
+        """
+        On Windows, place the spawned `process` in a kill-on-close job object
+        so the kernel ends it when this driver exits. Without this an
+        interrupted driver can leave matlab.exe running and holding gigabytes
+        of RAM, especially with the `automation` flag. No-op elsewhere.
+        """
+        if sys.platform != "win32":
+            return
+
+        # the job handle lives on the runner so the kernel keeps the
+        # job-process association for as long as the driver does
+        if self._job_handle is None:
+            self._job_handle = _create_kill_on_close_job()
+
+        # assignment is what actually enrolls the process; if it fails the
+        # kill-on-close guarantee does not exist, so surface it
+        if not _kernel32.AssignProcessToJobObject(
+                self._job_handle, int(process._handle)
+        ):
+            raise ctypes.WinError()
+
+    def queue(self, statement: Union[str, List[str]]) -> None:
+        """
+        Add `statement` to the queue of work to be run in a single MATLAB
+        process by the next call to `flush`.
+
+        Accepts the same statement strings or lists as `execute`.
+        """
+        if isinstance(statement, (list, tuple)):
+            statement = ", ".join(statement)
+
+        self._queue.append(statement)
+
+    def flush(
+            self,
+            batch=True,
+            auto_exit=True,
+            **execute_kwargs
+    ) -> Union[str, None]:
+        """
+        Run all queued statements in one MATLAB invocation and clear the
+        queue. Launching a single process for the whole batch pays the
+        MATLAB startup cost once instead of once per statement.
+
+        Each queued statement is wrapped in its own try-catch block so that
+        a failure in one does not abort the ones that follow.
+
+        The batch runs in its own one-shot process by default, even while a
+        persistent session is running, since the `batch` and `auto_exit`
+        defaults are launch-only flags. To route the batch through the
+        session instead, pass persistent=True together with batch=False and
+        auto_exit=False.
+
+        The queue is kept if `execute` raises, so the queued work survives a
+        failed flush and can be flushed again.
+
+        :param batch: Use the -batch run flag instead of -r
+        :param auto_exit: Append an exit command to the end of the batch
+        :param execute_kwargs: Additional keyword arguments passed to `execute`
+        """
+        if not self._queue:
+            return None
+
+        statements = [
+            _TRY_PREFIX + statement + _TRY_SUFFIX
+            for statement in self._queue
+        ]
+
+        execute_kwargs.setdefault('persistent', False)
+
+        output = self.execute(
+            statements, batch=batch, auto_exit=auto_exit, **execute_kwargs
+        )
+        self._queue = []
+
+        return output
+
+    def sweep(
+            self,
+            param_name: str,
+            values: List[Union[int, float]],
+            body_commands: Union[str, List[str]],
+            **execute_kwargs
+    ) -> Union[str, None]:
+        """
+        Run `body_commands` once for each value in `values`, with
+        `param_name` assigned to the current value, as a single MATLAB
+        `for` loop in one `execute` call.
+
+        Replaces the Python-level pattern of one `execute` per parameter
+        value, which pays MATLAB startup for every iteration; the generated
+        loop pays it once regardless of how many values there are.
+
+        Example - run myscript for three parameter values:
+            runner.sweep("param", [1, 2, 3], "myscript")
+
+        :param param_name: MATLAB variable name assigned on each iteration
+        :param values: Numeric values to iterate over
+        :param body_commands: Statement string or list run on each iteration
+            (see `execute` for the statement format)
+        :param execute_kwargs: Keyword arguments passed to `execute`
+        """
+        if isinstance(body_commands, (list, tuple)):
+            body_commands = ", ".join(body_commands)
+
+        values_literal = ", ".join(str(v) for v in values)
+
+        statement = \
+            f"for {param_name} = [{values_literal}]; {body_commands}; end"
+
+        return self.execute(statement, **execute_kwargs)
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether a persistent MATLAB session is currently running
+        """
+        return self._process is not None and self._process.poll() is None
+
+    def start(self, **subprocess_kwargs) -> None:
+        """
+        Launch a persistent MATLAB process that stays alive between
+        `execute` calls, so the interpreter and toolbox startup cost is only
+        paid once instead of on every call.
+
+        Statements are fed to the process over stdin and its output is read
+        back over stdout, so the `nodesktop` and `nosplash` options should be
+        set for the session to behave like a command line.
+
+        Does nothing if a session is already running.
+
+        :param subprocess_kwargs: Keyword arguments passed to subprocess.Popen
+        """
+        if self.started:
+            return
+
+        self._assert_exe_exists()
+
+        subprocess_kwargs.setdefault('bufsize', _PIPE_BUFFER_SIZE)
+
+        self._process = subprocess.Popen(
+            self._build_command_argv(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            **subprocess_kwargs
+        )
+        self._assign_to_job(self._process)
+
+    def stop(self) -> None:
+        """
+        Exit the persistent MATLAB session if one is running
+        """
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            self._process.stdin.write("exit\n")
+            self._process.stdin.flush()
+            self._process.wait()
+
+        self._process = None
+
+    def _execute_persistent(self, statement: str) -> str:
+        """
+        Send `statement` to the persistent MATLAB session and read its output
+        until the sentinel marking the end of the block appears.
+        Returns the output produced by the statement.
+        """
+        sentinel = sentinel_template.format(uuid.uuid4().hex)
+
+        self._process.stdin.write(f"{statement}\ndisp('{sentinel}')\n")
+        self._process.stdin.flush()
+
+        output_lines = []
+        for line in self._process.stdout:
+            if sentinel in line:
+                break
+            output_lines.append(line)
+
+        return "".join(output_lines)
+
     def execute(
             self,
             statement: Union[str, List[str]],
             batch=False,
             try_catch=False,
             auto_exit=False,
+            persistent: Union[bool, None] = None,
+            capture_output=False,
+            log_path: Union[str, None] = None,
+            validate=False,
             **subprocess_kwargs
-    ) -> None:
+    ) -> Union[str, None]:
         """
         Execute `statement` using the stored MATLAB executable and command line
         flags.
@@ -202,27 +681,312 @@ class MatlabRunner:
 
         :param batch: Use the -batch run flag instead of -r
         :param try_catch: Wrap `statement` in a try-catch block
-        :param auto_exit: Append an exit command to the end of `statement`
-        :param subprocess_kwargs: Keyword arguments passed to subprocess.call
+        :param auto_exit: Append an exit command to the end of `statement`.
+            Raises ValueError on the persistent session, which stays open
+            between calls; use `stop` or the context manager to end it.
+        :param persistent: Run `statement` in the persistent MATLAB session
+            (see the `start` method) instead of launching a new process,
+            starting a session first if necessary, and return its output.
+            Defaults to using the persistent session only when one is already
+            running. Pass False to force a one-shot process.
+        :param capture_output: Read the process output over a pipe and return
+            it instead of letting it reach the console (see `execute_async`)
+        :param log_path: Write the process output to this file via a pipe
+            rather than the `logfile` flag's disk round trip
+            (see `execute_async`). On the persistent session the collected
+            output is written once the statement finishes.
+        :param validate: Check each statement against the assignment /
+            script-call subset of MATLAB syntax before running, so obvious
+            typos fail in microseconds instead of after a process startup.
+            Statements outside that subset are rejected, so leave this off
+            for arbitrary MATLAB code.
+        :param subprocess_kwargs: Keyword arguments passed to subprocess.Popen
+            via `execute_async`
         """
-        self._assert_exe_exists()
+        if persistent is None:
+            persistent = self.started
+
+        if validate:
+            if isinstance(statement, (list, tuple)):
+                for item in statement:
+                    _validate_statement(item)
+            else:
+                _validate_statement(statement)
+
+        if isinstance(statement, (list, tuple)):
+            statement = ", ".join(statement)
+
+        if try_catch:
+            statement = _TRY_PREFIX + statement + _TRY_SUFFIX
+
+        if persistent:
+            if batch:
+                raise ValueError(
+                    "batch is a process launch flag and cannot be used "
+                    "with the persistent session"
+                )
+            if auto_exit:
+                raise ValueError(
+                    "auto_exit would end the persistent session; use "
+                    "`stop` or the context manager to close it instead"
+                )
+            if subprocess_kwargs:
+                raise ValueError(
+                    f"subprocess keyword arguments "
+                    f"{sorted(subprocess_kwargs)} only apply when launching "
+                    f"a process; pass them to `start` to configure the "
+                    f"persistent session instead"
+                )
+
+            self.start()
+            output = self._execute_persistent(
+                self._prepend_scratch_dir(statement)
+            )
 
-        header = self._build_command_header()
+            if log_path is not None:
+                with open(log_path, "w") as log_file:
+                    log_file.write(output)
+
+            return output
+
+        process = self.execute_async(
+            statement,
+            batch=batch,
+            auto_exit=auto_exit,
+            capture_output=capture_output,
+            log_path=log_path,
+            **subprocess_kwargs
+        )
+        process.wait()
+
+        if capture_output or log_path is not None:
+            process.matrun_drain_thread.join()
+            if capture_output:
+                return "".join(process.matrun_output_lines)
+
+    def execute_async(
+            self,
+            statement: Union[str, List[str]],
+            batch=False,
+            try_catch=False,
+            auto_exit=False,
+            capture_output=False,
+            log_path: Union[str, None] = None,
+            **subprocess_kwargs
+    ) -> subprocess.Popen:
+        """
+        Launch a MATLAB process running `statement` without waiting for it to
+        finish, and return the subprocess.Popen handle so the caller can
+        overlap MATLAB work with Python-side work or with other MATLAB
+        processes, calling `wait()` on the handle when the result is needed.
+
+        Takes the same statement strings or lists and the same `batch`,
+        `try_catch` and `auto_exit` arguments as `execute`.
+
+        :param capture_output: Read the process output directly over a pipe
+            instead of letting it reach the console. The collected lines are
+            attached to the returned handle as `matrun_output_lines` and are
+            complete once `matrun_drain_thread` has been joined.
+        :param log_path: Write the process output to this file. Unlike the
+            `logfile` flag the output still flows through a pipe and is
+            tee'd to the file by the driver, avoiding the write-then-reread
+            round trip through disk.
+        :param subprocess_kwargs: Keyword arguments passed to subprocess.Popen
+        """
+        self._assert_exe_exists()
 
         if batch:
             run_option = '-batch'
         else:
             run_option = '-r'
 
-        if isinstance(statement, Iterable) and not isinstance(statement, str):
+        if isinstance(statement, (list, tuple)):
             statement = ", ".join(statement)
 
         if try_catch:
-            statement = try_catch_wrapper.format(statement)
+            statement = _TRY_PREFIX + statement + _TRY_SUFFIX
+
+        statement = self._prepend_scratch_dir(statement)
 
         if auto_exit:
-            statement = exit_wrapper.format(statement)
+            statement = statement + _EXIT_SUFFIX
+
+        argv = [*self._build_command_argv(), run_option, statement]
+
+        capture = capture_output or log_path is not None
+
+        if capture:
+            subprocess_kwargs.setdefault('stdout', subprocess.PIPE)
+            subprocess_kwargs.setdefault('stderr', subprocess.STDOUT)
+            subprocess_kwargs.setdefault('universal_newlines', True)
+            subprocess_kwargs.setdefault('bufsize', _PIPE_BUFFER_SIZE)
 
-        command = f'{header} {run_option} "{statement}"'
+        process = subprocess.Popen(argv, **subprocess_kwargs)
+        self._assign_to_job(process)
+
+        if capture:
+            process.matrun_output_lines = []
+            process.matrun_drain_thread = threading.Thread(
+                target=_drain_output,
+                args=(process.stdout, process.matrun_output_lines, log_path),
+                daemon=True
+            )
+            process.matrun_drain_thread.start()
+
+        return process
+
+    def map(
+            self,
+            statements: List[Union[str, List[str]]],
+            max_parallel: int = 2,
+            capture_output=False,
+            **execute_async_kwargs
+    ) -> List[Union[int, str]]:
+        """
+        Run each statement in `statements` in its own MATLAB process, keeping
+        at most `max_parallel` processes in flight at a time, and return the
+        exit code (or, with `capture_output`, the output) of each process in
+        input order.
+
+        :param statements: List of statement strings or lists, each run as a
+            separate process (see `execute` for the statement format)
+        :param max_parallel: Maximum number of MATLAB processes to run at once
+        :param capture_output: Return each process's output instead of its
+            exit code. On POSIX systems all in-flight processes are drained
+            by one selector loop rather than a thread per process.
+        :param execute_async_kwargs: Keyword arguments passed to
+            `execute_async` for every statement. `log_path` is rejected:
+            every process would write over the same file, and on the POSIX
+            capture path its drain thread would race the selector loop for
+            the same stdout.
+        """
+        if 'log_path' in execute_async_kwargs:
+            raise ValueError(
+                "log_path cannot be used with map; capture the outputs "
+                "with capture_output=True and write them to per-run files "
+                "instead"
+            )
+
+        if capture_output:
+            if os.name == "posix":
+                return self._map_capture_selector(
+                    statements, max_parallel, **execute_async_kwargs
+                )
+
+            # elsewhere fall back to a drain thread per in-flight process
+            with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+                return list(pool.map(
+                    lambda statement:
+                        self.execute(
+                            statement,
+                            persistent=False,
+                            capture_output=True,
+                            **execute_async_kwargs
+                        ),
+                    statements
+                ))
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            return list(pool.map(
+                lambda statement:
+                    self.execute_async(
+                        statement, **execute_async_kwargs
+                    ).wait(),
+                statements
+            ))
+
+    def _map_capture_selector(
+            self,
+            statements: List[Union[str, List[str]]],
+            max_parallel: int,
+            **execute_async_kwargs
+    ) -> List[str]:
+        """
+        POSIX implementation of `map` with output capture: a single selector
+        loop reads every in-flight process's stdout as chunks become
+        available, so draining dozens of MATLAB children costs one loop
+        instead of one thread each.
+        """
+        total = len(statements)
+        outputs: List[Union[str, None]] = [None] * total
+        buffers = {}
+        selector = selectors.DefaultSelector()
+        launched = 0
+        active = 0
+        finished = 0
+
+        def _launch(index):
+            process = self.execute_async(
+                statements[index],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                **execute_async_kwargs
+            )
+            os.set_blocking(process.stdout.fileno(), False)
+            selector.register(
+                process.stdout, selectors.EVENT_READ, (index, process)
+            )
+            buffers[index] = []
+
+        try:
+            while finished < total:
+                while launched < total and active < max_parallel:
+                    _launch(launched)
+                    launched += 1
+                    active += 1
+
+                for key, _ in selector.select():
+                    index, process = key.data
+                    try:
+                        chunk = os.read(key.fd, _PIPE_BUFFER_SIZE)
+                    except BlockingIOError:
+                        continue
+
+                    if chunk:
+                        buffers[index].append(chunk)
+                    else:
+                        # EOF: the process has closed its stdout
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        process.wait()
+                        outputs[index] = \
+                            b"".join(buffers.pop(index)).decode()
+                        active -= 1
+                        finished += 1
+        finally:
+            selector.close()
+
+        return outputs
+
+    def map_parallel(
+            self,
+            statements: List[Union[str, List[str]]],
+            n_processes: Union[int, None] = None
+    ) -> List[str]:
+        """
+        Run the statements in `statements` across a pool of worker processes,
+        each owning its own persistent MATLAB session, and return the output
+        of each statement in input order.
+
+        Suited to many independent MATLAB runs such as parameter sweeps,
+        where the work scales with the number of cores. Each worker pays
+        MATLAB startup once for its whole share of the statements.
+
+        :param statements: List of statement strings or lists, each run as a
+            separate work item (see `execute` for the statement format)
+        :param n_processes: Number of worker processes (and persistent MATLAB
+            sessions) to use. Defaults to the number of cores.
+        """
+        with multiprocessing.Pool(
+                n_processes,
+                initializer=_init_worker_runner,
+                initargs=(self._exe_path, self._options)
+        ) as pool:
+            # unordered harvesting keeps long-running items from stalling
+            # the whole batch; the index carried with each item restores
+            # input order afterwards
+            results = dict(
+                pool.imap_unordered(_run_in_worker, enumerate(statements))
+            )
 
-        subprocess.call(command, **subprocess_kwargs)
+        return [results[index] for index in range(len(statements))]